@@ -0,0 +1,32 @@
+# Author: Rahul Shah
+"""#30DayMapChallenge maps as importable pipelines.
+
+Each day lives in its own module with a ``render(**params)`` function. The
+modules (and their heavy imports: osmnx, cartopy, contextily, folium, ...)
+are only loaded when that day is rendered.
+"""
+
+import importlib
+
+# day name -> module implementing render()
+DAYS = {
+    "day1": "mapchallenge.day1",
+    "day1_folium": "mapchallenge.day1_folium",
+    "day2": "mapchallenge.day2",
+    "day3": "mapchallenge.day3",
+    "day7": "mapchallenge.day7",
+    "day8": "mapchallenge.day8",
+    "day22": "mapchallenge.day22",
+}
+
+
+def load(day):
+    """Import and return the module for `day`."""
+    if day not in DAYS:
+        raise KeyError(f"Unknown day {day!r}, choose from {sorted(DAYS)}")
+    return importlib.import_module(DAYS[day])
+
+
+def render(day, **params):
+    """Render `day` with the given parameters and return the output path."""
+    return load(day).render(**params)
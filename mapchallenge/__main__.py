@@ -0,0 +1,3 @@
+from mapchallenge.cli import main
+
+main()
@@ -0,0 +1,154 @@
+# Author: Rahul Shah
+"""Command line entry point.
+
+    mapchallenge list
+    mapchallenge render day2 --country NP --name Nepal
+    mapchallenge render day2 --help          # parameters of one day
+    mapchallenge worker --preload day2 day22 < requests.jsonl
+
+Each render parameter becomes a --option built from the day's render()
+signature. The worker reads one JSON request per line from stdin, e.g.
+{"day": "day2", "country": "NP"}, and answers with one JSON line per
+request; datasets and imported modules stay loaded between requests.
+{"command": "clear"} drops the cached datasets and {"command": "stats"}
+reports the cache sizes.
+"""
+
+import argparse
+import contextlib
+import inspect
+import json
+import sys
+import traceback
+
+import mapchallenge
+from mapchallenge import datasets
+from mapchallenge.profiling import RunProfiler
+
+
+def _use_agg(show=False):
+    """Render off-screen unless the map is meant to be shown."""
+    if not show:
+        import matplotlib
+        matplotlib.use("Agg")
+
+
+def day_parser(day):
+    """Build an argument parser for the render() parameters of `day`."""
+    module = mapchallenge.load(day)
+    parser = argparse.ArgumentParser(prog=f"mapchallenge render {day}",
+                                     description=inspect.getdoc(module.render))
+    for name, param in inspect.signature(module.render).parameters.items():
+        if name == "run":
+            continue
+        option = "--" + name.replace("_", "-")
+        default = param.default
+        if isinstance(default, bool):
+            parser.add_argument(option, dest=name, default=default,
+                                action=argparse.BooleanOptionalAction)
+        else:
+            kind = str if default is None else type(default)
+            parser.add_argument(option, dest=name, default=default, type=kind,
+                                help=f"default: {default}")
+    return parser
+
+
+def render(day, params, profile_output=None):
+    """Render one day with its own profiler and return a JSON-serialisable result."""
+    run = RunProfiler(day)
+    result = {"day": day, "params": params}
+    try:
+        result["output"] = mapchallenge.render(day, run=run, **params)
+    except Exception as e:
+        traceback.print_exc(file=sys.stderr)
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        _close_figures()
+    result["profile"] = run.write(profile_output)
+    return result
+
+
+def _close_figures():
+    """Close the figures a render left open, also when it failed half-way.
+
+    An open figure keeps everything plotted on it alive, so in the worker a
+    failed request would otherwise leak its GeoDataFrames.
+    """
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    if pyplot is not None:
+        pyplot.close("all")
+
+
+def cmd_list(args):
+    for day, module in mapchallenge.DAYS.items():
+        print(f"{day:<12} {module}")
+    return 0
+
+
+def cmd_render(args):
+    params = vars(day_parser(args.day).parse_args(args.params))
+    _use_agg(params.get("show", False))
+    result = render(args.day, params, args.profile_output)
+    return 1 if "error" in result else 0
+
+
+def cmd_worker(args):
+    _use_agg()
+    for day in args.preload:
+        mapchallenge.load(day)
+    print(json.dumps({"ready": True, "preloaded": args.preload}), flush=True)
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            command = request.get("command")
+            if command is not None:
+                print(json.dumps(worker_command(command)), flush=True)
+                continue
+            day = request.pop("day")
+            if day not in mapchallenge.DAYS:
+                raise KeyError(day)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            result = {"error": f"Bad request {line!r}: {type(e).__name__}: {e}"}
+        else:
+            request.pop("show", None)
+            # keep stdout for the JSON replies; progress messages go to stderr
+            with contextlib.redirect_stdout(sys.stderr):
+                result = render(day, request)
+        print(json.dumps(result, default=str), flush=True)
+    return 0
+
+
+def worker_command(command):
+    """Handle a worker request that is not a render."""
+    if command == "clear":
+        datasets.clear()
+        return {"command": command, "cache": datasets.info()}
+    if command == "stats":
+        return {"command": command, "cache": datasets.info()}
+    return {"error": f"Unknown command {command!r}, choose from ['clear', 'stats']"}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="mapchallenge", description="#30DayMapChallenge maps")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="list the available days")
+    list_parser.set_defaults(func=cmd_list)
+
+    render_parser = subparsers.add_parser("render", help="render one day's map", add_help=False)
+    render_parser.add_argument("day", choices=sorted(mapchallenge.DAYS))
+    render_parser.add_argument("--profile-output", help="path of the JSON profile report (give it before the day)")
+    render_parser.add_argument("params", nargs=argparse.REMAINDER,
+                               help="day parameters, see `mapchallenge render <day> --help`")
+    render_parser.set_defaults(func=cmd_render)
+
+    worker_parser = subparsers.add_parser("worker", help="serve JSON render requests from stdin")
+    worker_parser.add_argument("--preload", nargs="*", default=[], choices=sorted(mapchallenge.DAYS),
+                               help="days to import before the first request")
+    worker_parser.set_defaults(func=cmd_worker)
+
+    args = parser.parse_args(argv)
+    sys.exit(args.func(args))
@@ -0,0 +1,57 @@
+# Author: Rahul Shah
+"""Cached data loaders shared by the day pipelines.
+
+Everything here is memoised per process, so a long-running worker only pays
+for a download or a big read_file once. Each loader keeps its
+MAPCHALLENGE_CACHE_SIZE (default 4) most recently used results and drops the
+rest. Cached frames are shared between renders: filter/reproject them into a
+new frame instead of editing in place.
+"""
+
+import functools
+import os
+import zipfile
+
+CACHE_SIZE = int(os.environ.get("MAPCHALLENGE_CACHE_SIZE", "4"))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def read_vector(source, layer=None):
+    """gpd.read_file, cached on (source, layer)."""
+    import geopandas as gpd
+    if layer is None:
+        return gpd.read_file(source)
+    return gpd.read_file(source, layer=layer)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def read_table(source):
+    """pd.read_csv, cached on source."""
+    import pandas as pd
+    return pd.read_csv(source)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def download_and_extract(url, file_name):
+    """Download a zip archive (unless already on disk) and extract it next to it."""
+    if not os.path.exists(file_name):
+        import requests
+        r = requests.get(url)
+        r.raise_for_status()
+        with open(file_name, 'wb') as outfile:
+            outfile.write(r.content)
+    with zipfile.ZipFile(file_name, 'r') as zip_ref:
+        zip_ref.extractall(os.path.dirname(file_name) or ".")
+    return file_name
+
+
+def clear():
+    """Drop every in-memory dataset (the files on disk are kept)."""
+    for loader in (read_vector, read_table, download_and_extract):
+        loader.cache_clear()
+
+
+def info():
+    """Hits, misses and size of each loader's cache."""
+    return {loader.__name__: loader.cache_info()._asdict()
+            for loader in (read_vector, read_table, download_and_extract)}
@@ -0,0 +1,126 @@
+## US Fire Map
+# Author: Rahul Shah
+"""Day 1 (interactive): animated folium map of NASA FIRMS fire hotspots."""
+
+import os
+import pandas as pd
+import folium
+from folium import plugins
+from datetime import datetime, timedelta
+from mapchallenge.firms import area_coords, get_fire_data, main_url
+from mapchallenge.profiling import RunProfiler
+
+# Add custom legend
+legend_html = '''
+<div style="position: fixed;
+bottom: 50px; right: 50px; width: 120px; height: 90px;
+border:2px solid grey; z-index:9999; font-size:14px;
+background-color:white;
+">&nbsp; Temperature <br>
+&nbsp; <i class="fa fa-circle fa-1x" style="color:#ffcccb"></i> Low<br>
+&nbsp; <i class="fa fa-circle fa-1x" style="color:#ff6666"></i> Medium<br>
+&nbsp; <i class="fa fa-circle fa-1x" style="color:#ff0000"></i> High
+</div>
+'''
+
+# Add attribution (moved higher)
+attribution = "Data: NASA FIRMS | Map Created by Rahul Shah (@rahul_geo)"
+attribution_html = f'''
+<div style="
+    position: fixed;
+    bottom: 100px;
+    left: 10px;
+    width: 250px;
+    z-index:9999;
+    font-size:12px;
+    background-color:white;
+    border:2px solid grey;
+    padding: 5px;
+    ">
+    {attribution}
+</div>
+'''
+
+
+def render(map_key=None,
+           source="VIIRS_SNPP_NRT",
+           day_range=10,
+           date=None,
+           output="fire-us-topo-animated.html",
+           run=None):
+    """Build the animated hotspot map and save it as HTML to `output`.
+
+    `map_key` is the FIRMS API key and defaults to the FIRMS_MAP_KEY environment variable.
+    """
+    run = run or RunProfiler("day1_folium")
+    map_key = map_key or os.environ.get("FIRMS_MAP_KEY", "")
+    date = date or (datetime.now() - timedelta(days=11)).strftime('%Y-%m-%d')
+
+    # 2. FIRE DATA
+    with run.stage("download_fires") as stage:
+        fire_data = get_fire_data(main_url, map_key, source, area_coords, day_range, date)
+        stage.count(rows=len(fire_data))
+    if fire_data.empty:
+        raise RuntimeError("No fire data returned by the FIRMS API")
+
+    # 3. CREATE MAP
+    m = folium.Map(location=[37.5, -96], zoom_start=4, tiles='OpenTopoMap')
+
+    # 4. PREPARE FIRE DATA FOR ANIMATION
+    fire_data['datum'] = pd.to_datetime(fire_data['acq_date'])
+    fire_data['bright_ti5_celsius'] = fire_data['bright_ti5'] - 273.15
+
+    # Create a color map function (different shades of red)
+    low = fire_data['bright_ti5_celsius'].quantile(0.33)
+    high = fire_data['bright_ti5_celsius'].quantile(0.66)
+
+    def get_color(temp):
+        if temp < low:
+            return '#ffcccb'  # light red
+        elif temp < high:
+            return '#ff6666'  # medium red
+        else:
+            return '#ff0000'  # bright red
+
+    # Prepare GeoJSON for TimestampedGeoJson
+    with run.stage("build_features") as stage:
+        features = []
+        for _, fire in fire_data.iterrows():
+            feature = {
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'Point',
+                    'coordinates': [fire['longitude'], fire['latitude']]
+                },
+                'properties': {
+                    'time': fire['datum'].strftime('%Y-%m-%d'),
+                    'popup': f"Date: {fire['datum']}<br>Temperature: {fire['bright_ti5_celsius']:.2f}°C",
+                    'icon': 'circle',
+                    'iconstyle': {
+                        'fillColor': get_color(fire['bright_ti5_celsius']),
+                        'fillOpacity': 0.7,
+                        'stroke': 'false',  # Remove border
+                        'radius': 5
+                    }
+                }
+            }
+            features.append(feature)
+        stage.count(rows=len(features))
+
+    # Add TimestampedGeoJson to map
+    plugins.TimestampedGeoJson({
+        'type': 'FeatureCollection',
+        'features': features
+    }, period='P1D', add_last_point=True, auto_play=False, loop=False).add_to(m)
+
+    m.get_root().html.add_child(folium.Element(legend_html))
+    m.get_root().html.add_child(folium.Element(attribution_html))
+
+    # Add layer control
+    folium.LayerControl().add_to(m)
+
+    # Save the map
+    with run.stage("save_html"):
+        m.save(output)
+    print(f"Animated map saved as {output}")
+    return output
@@ -0,0 +1,132 @@
+## Author: Rahul Shah
+## Inspired from Milos Popovic
+"""Day 2: rivers and river basins of a country from HydroSHEDS."""
+
+import geopandas as gpd
+import os
+from matplotlib import pyplot as plt
+from mapchallenge import datasets
+from mapchallenge.export import save_figure
+from mapchallenge.profiling import RunProfiler
+
+resolution_choices = ["01M", "03M", "10M", "30M", "60M"]
+
+# HydroRIVERS flow order -> line width
+river_widths = {1: 0.8, 2: 0.7, 3: 0.6, 4: 0.45, 5: 0.35, 6: 0.25, 7: 0.2, 8: 0.15, 9: 0.1}
+
+
+def render(country="NP",
+           name="Nepal",
+           res="60M",
+           basins_url="https://data.hydrosheds.org/file/HydroBASINS/standard/hybas_as_lev03_v1c.zip",
+           rivers_path=os.path.join("HydroRIVERS_v10_as_shp", "HydroRIVERS_v10_as.shp"),
+           output="Day2_Nepal-river-basins_black1.png",
+           dpi=300,
+           tiled=False,
+           show=False,
+           run=None):
+    """Plot the glowing rivers of `country` (GISCO CNTR_ID) and save the map to `output`."""
+    if res not in resolution_choices:
+        raise ValueError(f"res must be one of {resolution_choices}, got {res!r}")
+    run = run or RunProfiler("day2")
+
+    # 1. GET COUNTRY BORDERS
+    with run.stage("read_borders") as stage:
+        world_country_borders = datasets.read_vector(
+            f"https://gisco-services.ec.europa.eu/distribution/v2/countries/geojson/CNTR_RG_{res}_2020_4326.geojson")
+        stage.count(world_country_borders)
+    country_border = world_country_borders[world_country_borders["CNTR_ID"] == country]
+    if country_border.empty:
+        raise ValueError(f"Unknown country code {country!r}")
+
+    # 2. GET RIVER BASINS
+    file_name = basins_url.rsplit("/", 1)[-1]
+    with run.stage("download_basins"):
+        datasets.download_and_extract(basins_url, file_name)
+
+    with run.stage("read_basins") as stage:
+        basins = datasets.read_vector(file_name.split(".")[0]+".shp")
+        stage.count(basins)
+    with run.stage("overlay_basins") as stage:
+        country_basin = gpd.overlay(
+            country_border, basins, how='intersection')
+        stage.count(country_basin)
+
+    # 3. GET RIVERS
+    with run.stage("read_rivers") as stage:
+        rivers = datasets.read_vector(rivers_path)
+        stage.count(rivers)
+    with run.stage("overlay_rivers") as stage:
+        country_river_basin = gpd.overlay(
+            rivers, country_basin, how='intersection')
+        stage.count(country_river_basin)
+
+    # 4. RIVER WIDTH
+    with run.stage("river_width") as stage:
+        country_river_basin['width'] = country_river_basin['ORD_FLOW'].map(river_widths).fillna(0)
+        stage.count(rows=len(country_river_basin))
+
+    # 5. ENHANCED PLOTTING
+    # ------------------
+    # Create figure with higher DPI for better quality
+    fig, ax = plt.subplots(figsize=(10, 10), dpi=dpi)
+    fig.patch.set_facecolor('black')
+    ax.set_facecolor('black')
+
+    # Get the bounds of the country for zooming
+    bounds = country_border.total_bounds
+    # Add some padding (10%) to the bounds
+    padding = 0.1
+    x_padding = (bounds[2] - bounds[0]) * padding
+    y_padding = (bounds[3] - bounds[1]) * padding
+    ax.set_xlim([bounds[0] - x_padding, bounds[2] + x_padding])
+    ax.set_ylim([bounds[1] - y_padding, bounds[3] + y_padding])
+
+    with run.stage("plot"):
+        # Plot basins with a subtle color scheme
+        country_basin.plot(ax=ax, color='#1a1a1a', alpha=0.5, linewidth=0.5,
+                          linestyle='--', edgecolor='#333333')
+
+        # Create glow effect by plotting multiple times with decreasing width and opacity
+        glow_color = '#4287f5'  # Blue color for rivers
+        n_glow_lines = 10  # Number of lines to create glow effect
+
+        for i in range(n_glow_lines):
+            # Plot with decreasing width and opacity
+            scale = 1 + (n_glow_lines - i) * 0.2
+            alpha = 0.03 * (n_glow_lines - i)
+
+            country_river_basin.plot(ax=ax, color=glow_color,
+                                   linewidth=country_river_basin['width'] * scale,
+                                   alpha=alpha)
+
+        # Plot the final, sharpest rivers on top
+        country_river_basin.plot(ax=ax, color='white',
+                               linewidth=country_river_basin['width'],
+                               alpha=1)
+
+    # Enhanced text styling
+    ax.text(0.5, 1.02, f'Rivers of {name}',
+            ha='center', va='top', transform=ax.transAxes,
+            fontsize=36, color='white', weight='bold')
+
+    ax.text(0.9, 0.02, 'Map created by Rahul Shah (@rahul_geo)',
+            ha='right', va='bottom', transform=ax.transAxes,
+            fontsize=12, color='#808080', style='italic')
+    ax.text(0.1, 0.02, 'Data Source: HydroSheds',
+            ha='left', va='bottom', transform=ax.transAxes,
+            fontsize=12, color='#808080', style='italic')
+
+    # Remove axis
+    ax.set_axis_off()
+
+    # Tight layout to maximize map size
+    fig.tight_layout()
+    with run.stage("savefig"):
+        save_figure(fig, output, dpi=dpi, tiled=tiled, ax=ax, crs=country_border.crs,
+                    facecolor='black')
+    print(f"Map saved as {output}")
+    if show:
+        plt.show()
+    plt.close(fig)
+    return output
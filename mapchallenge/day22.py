@@ -0,0 +1,94 @@
+# Author: Rahul Shah
+"""Day 22: US cargo ship traffic from the ESRI vessel traffic geodatabase."""
+
+import matplotlib.pyplot as plt
+import cartopy.crs as ccrs
+import cartopy.feature as cfeature
+from mapchallenge import datasets
+from mapchallenge.export import save_figure
+from mapchallenge.profiling import RunProfiler
+
+
+def render(gdb_folder="US_Vessel_Traffic_2024_03.gdb",
+           layer="US_Vessel_Traffic_2024_03",
+           states_path="us_states_data/cb_2020_us_state_20m.shp",
+           vessel_group="Cargo",
+           tolerance=0.01,
+           title="US Cargo Ship Traffic - March 2024",
+           output="us_cargo_ship_traffic_2color.png",
+           dpi=300,
+           tiled=False,
+           run=None):
+    """Plot the tracks of one vessel group over the US and save the map to `output`."""
+    run = run or RunProfiler("day22")
+
+    # Load the vessel traffic data
+    with run.stage("read_file") as stage:
+        vessel_data = datasets.read_vector(gdb_folder, layer)
+        stage.count(vessel_data)
+
+    # Filter for cargo ships
+    with run.stage("filter") as stage:
+        cargo_ships = vessel_data[vessel_data['vessel_group'] == vessel_group]
+        stage.count(rows=len(cargo_ships))
+
+    print(f"Number of {vessel_group.lower()} ship tracks: {len(cargo_ships)}")
+
+    # Ensure the data is in the correct CRS
+    with run.stage("to_crs") as stage:
+        cargo_ships = cargo_ships.to_crs(epsg=4326)
+        stage.count(rows=len(cargo_ships))
+
+    # Simplify the geometries to reduce complexity
+    with run.stage("simplify") as stage:
+        cargo_ships['geometry'] = cargo_ships.geometry.simplify(tolerance=tolerance)
+        stage.count(cargo_ships)
+
+    # Load US states for the basemap
+    with run.stage("read_states") as stage:
+        usa = datasets.read_vector(states_path)
+        stage.count(usa)
+
+    with run.stage("plot"):
+        # Set up the map
+        fig, ax = plt.subplots(figsize=(20, 15), subplot_kw={'projection': ccrs.AlbersEqualArea(central_longitude=-96, central_latitude=37.5)})
+
+        # Set extent to cover the entire US including Alaska and Hawaii
+        ax.set_extent([-137.69995498, -60.37662866, 17.15849535, 50.73010450], crs=ccrs.PlateCarree())
+
+        # Add US states
+        usa.plot(ax=ax, color='black', edgecolor='#333333', linewidth=0.5)
+
+        # Plot cargo ship tracks in red
+        cargo_ships.plot(ax=ax, color='red', linewidth=0.5, alpha=0.5, transform=ccrs.PlateCarree())
+
+        # Add coastlines
+        ax.add_feature(cfeature.COASTLINE, edgecolor='#333333', linewidth=0.5)
+
+        # Remove axes
+        ax.axis('off')
+
+        # Add title
+        ax.set_title(title, fontsize=24, fontweight='bold', color='white')
+
+        # Add attribution
+        ax.text(0.95, 0.05, 'Map: Rahul Shah (@rahul_geo)\nData: ESRI Atlas',
+                horizontalalignment='right', verticalalignment='bottom', transform=ax.transAxes,
+                fontsize=12, color='white')
+
+        # Set background color
+        fig.patch.set_facecolor('black')
+        ax.set_facecolor('black')
+
+    # Save the map
+    with run.stage("savefig"):
+        save_figure(fig, output, dpi=dpi, tiled=tiled, ax=ax, crs=ax.projection,
+                    bbox_inches='tight', facecolor='black')
+        plt.close(fig)
+
+    print(f"Map has been saved as '{output}'")
+
+    # Print some additional information
+    print(f"Cargo ships data CRS: {cargo_ships.crs}")
+    print(f"Bounding box of cargo ships data: {cargo_ships.total_bounds}")
+    return output
@@ -0,0 +1,103 @@
+"""Day 3: building footprints of a city from OpenStreetMap."""
+
+# Import required libraries
+import osmnx as ox
+import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+import warnings
+from mapchallenge.export import save_figure
+from mapchallenge.profiling import RunProfiler
+
+# Choose one of these color schemes:
+color_schemes = {
+    'neon_city': ["#00ffff", "#ff00ff"],  # Cyberpunk feel
+    'sunset': ["#FF4E50", "#F9D423"],      # Warm sunset colors
+    'ocean': ["#43cea2", "#185a9d"],       # Ocean blues/greens
+    'purple_gold': ["#904e95", "#e96443"], # Royal colors
+    'matrix': ["#00ff00", "#003300"],      # Matrix-style
+    'fire': ["#ff0000", "#ffff00"]         # Fire colors
+}
+
+
+def create_building_map(city_name, colors, title, run):
+    """Create a building footprint map for the specified city"""
+    # Create a custom colormap
+    cmap = mcolors.LinearSegmentedColormap.from_list("custom", colors)
+
+    # Get the administrative boundary
+    print(f"Downloading data for {city_name}...")
+    with run.stage("geocode") as stage:
+        admin_district = ox.geocode_to_gdf(city_name)
+        admin_poly = admin_district.geometry.values[0]
+        stage.count(admin_district)
+
+    # Download building footprints
+    print("Downloading building footprints...")
+    with run.stage("download_buildings") as stage:
+        footprints = ox.features_from_polygon(admin_poly, tags={"building": True})
+        stage.count(footprints)
+    print(f"Number of buildings: {len(footprints)}")
+
+    # Create the plot
+    fig, ax = plt.subplots(1, 1, figsize=(12, 15), facecolor='black')
+
+    # Plot buildings
+    with run.stage("plot"):
+        footprints.plot(
+            ax=ax,
+            cmap=cmap,
+            alpha=0.9,
+            linewidth=0.5,
+            edgecolor='#2d2d2d'
+        )
+
+    # Customize the plot
+    ax.axis('off')
+    ax.set_title(title,
+                 pad=20,
+                 color='white',
+                 fontsize=20,
+                 fontfamily='monospace')
+
+    # Add attribution
+    ax.text(
+        0.02, 0.02,
+        'Data: OpenStreetMap Contributors\nMap: Rahul shah (@rahul_geo) | #30DayMapChallenge',
+        transform=ax.transAxes,
+        color='white',
+        fontsize=10,
+        alpha=0.7,
+        fontfamily='monospace'
+    )
+
+    return fig, ax
+
+
+def render(city="Manhattan, New York City",
+           scheme="sunset",
+           title=None,
+           output="Day3_MANHATTAN_BUILDING_FOOTPRINTS2.png",
+           dpi=300,
+           tiled=False,
+           show=False,
+           run=None):
+    """Render the building footprints of `city` in one of `color_schemes` and save to `output`."""
+    if scheme not in color_schemes:
+        raise ValueError(f"scheme must be one of {sorted(color_schemes)}, got {scheme!r}")
+    run = run or RunProfiler("day3")
+    title = title or f"{city.split(',')[0].upper()}\nBUILDING FOOTPRINTS"
+    ox.settings.log_console = True
+    ox.settings.use_cache = True
+
+    # Set up the plotting style
+    with warnings.catch_warnings(), plt.style.context('dark_background'):
+        warnings.simplefilter('ignore')
+        fig, ax = create_building_map(city, color_schemes[scheme], title, run)
+        with run.stage("savefig"):
+            save_figure(fig, output, dpi=dpi, tiled=tiled, ax=ax, crs="EPSG:4326",
+                        bbox_inches='tight', facecolor='black')
+    print(f"Map saved as {output}")
+    if show:
+        plt.show()
+    plt.close(fig)
+    return output
@@ -0,0 +1,117 @@
+##Author: Rahul Shah
+"""Day 7: vintage-style building and river map of a city from OpenStreetMap."""
+
+import osmnx as ox
+import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+from matplotlib.patches import Rectangle
+import warnings
+from mapchallenge.export import save_figure
+from mapchallenge.profiling import RunProfiler
+
+# Vintage color scheme
+vintage_colors = ['#f3e7d3', '#d6c6a9']
+
+
+def create_vintage_building_map(city_name, colors, title, run):
+    """Create a vintage-style building footprint map for the specified city"""
+    # Create a custom colormap
+    cmap = mcolors.LinearSegmentedColormap.from_list("custom", colors)
+
+    # Get the administrative boundary
+    print(f"Downloading data for {city_name}...")
+    with run.stage(f"geocode:{city_name}") as stage:
+        admin_district = ox.geocode_to_gdf(city_name)
+        admin_poly = admin_district.geometry.values[0]
+        stage.count(admin_district)
+
+    # Download building footprints
+    print("Downloading building footprints...")
+    with run.stage(f"download_buildings:{city_name}") as stage:
+        footprints = ox.features_from_polygon(admin_poly, tags={"building": True})
+        stage.count(footprints)
+    print(f"Number of buildings: {len(footprints)}")
+
+    # Download rivers
+    print("Downloading rivers...")
+    with run.stage(f"download_rivers:{city_name}") as stage:
+        rivers = ox.features_from_polygon(admin_poly, tags={"waterway": ["river", "stream", "canal"]})
+        stage.count(rivers)
+    print(f"Number of river features: {len(rivers)}")
+
+    # Create the plot
+    fig, ax = plt.subplots(1, 1, figsize=(12, 15), facecolor='#f3e7d3')  # Vintage paper color
+
+    with run.stage(f"plot:{city_name}"):
+        # Plot rivers
+        rivers.plot(ax=ax, color='#4a7496', linewidth=1, alpha=0.7)
+
+        # Plot buildings
+        footprints.plot(
+            ax=ax,
+            cmap=cmap,
+            alpha=0.9,
+            linewidth=0.5,
+            edgecolor='#8b7765'  # Vintage brown color
+        )
+
+    # Customize the plot
+    ax.axis('off')
+    ax.set_title(title,
+        pad=20,
+        color='#8b7765',  # Vintage brown color
+        fontsize=20,
+        fontfamily='serif',
+        fontweight='bold'
+    )
+
+    # Add a border to mimic old map style
+    border = Rectangle((0, 0), 1, 1, transform=ax.transAxes, fill=False,
+                       edgecolor='#8b7765', linewidth=5)
+    ax.add_patch(border)
+
+    # Add attribution
+    ax.text(
+        0.02, 0.02,
+        'Data: OpenStreetMap Contributors\nMap: Rahul shah (@rahul_geo) | #30DayMapChallenge',
+        transform=ax.transAxes,
+        color='#8b7765',
+        fontsize=10,
+        alpha=0.7,
+        fontfamily='serif',
+        bbox=dict(facecolor='#f3e7d3', edgecolor='#8b7765', alpha=0.7)
+    )
+
+    return fig, ax
+
+
+def render(city="London, United Kingdom",
+           title=None,
+           output=None,
+           dpi=300,
+           tiled=False,
+           show=False,
+           run=None):
+    """Render the vintage map of `city` and save it (default: vintage_<city>_building_map_with_rivers.png)."""
+    run = run or RunProfiler("day7")
+    title = title or f"{city.split(',')[0].upper()}\nBUILDING FOOTPRINTS"
+    output = output or f"vintage_{city.split(',')[0].lower().replace(' ', '_')}_building_map_with_rivers.png"
+    ox.settings.log_console = True
+    ox.settings.use_cache = True
+    ox.settings.requests_timeout = 300
+
+    print(f"\nCreating map for {city}")
+    # Set up the plotting style
+    with warnings.catch_warnings(), plt.style.context('default'):
+        warnings.simplefilter('ignore')
+        fig, ax = create_vintage_building_map(city, vintage_colors, title, run)
+
+        # Save the plot
+        with run.stage(f"savefig:{city}"):
+            save_figure(fig, output, dpi=dpi, tiled=tiled, ax=ax, crs="EPSG:4326",
+                        bbox_inches='tight', facecolor='#f3e7d3')
+    print(f"Vintage-style {city} building map with rivers saved as '{output}'")
+    if show:
+        plt.show()
+    plt.close(fig)
+    return output
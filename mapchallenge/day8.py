@@ -0,0 +1,98 @@
+##Author: Rahul Shah
+"""Day 8: obesity rates by state in the continental US (HDX data)."""
+
+import matplotlib.pyplot as plt
+import contextily as ctx
+from mpl_toolkits.axes_grid1 import make_axes_locatable
+from mapchallenge import datasets
+from mapchallenge.export import save_figure
+from mapchallenge.profiling import RunProfiler
+
+
+def render(obesity_csv="LakeCounty_Health_2397514566901885190.csv",
+           states_url="https://www2.census.gov/geo/tiger/GENZ2020/shp/cb_2020_us_state_20m.zip",
+           output="US_obesity_rates_map_updated.png",
+           dpi=300,
+           tiled=False,
+           show=False,
+           run=None):
+    """Plot the state obesity choropleth from `obesity_csv` and save it to `output`."""
+    run = run or RunProfiler("day8")
+
+    # Load the obesity data
+    with run.stage("read_csv") as stage:
+        obesity_data = datasets.read_table(obesity_csv)
+        stage.count(rows=len(obesity_data))
+
+    # Load US states shapefile
+    with run.stage("read_states") as stage:
+        us_states = datasets.read_vector(states_url)
+        stage.count(us_states)
+
+    # Merge obesity data with shapefile
+    with run.stage("merge") as stage:
+        merged = us_states.merge(obesity_data, left_on='NAME', right_on='NAME', how='left')
+        stage.count(rows=len(merged))
+
+    # Convert to Web Mercator projection for basemap
+    with run.stage("to_crs") as stage:
+        merged = merged.to_crs(epsg=3857)
+        stage.count(merged)
+
+    # Filter for continental US
+    merged_continental = merged[~merged['NAME'].isin(['Alaska', 'Hawaii', 'Puerto Rico'])]
+
+    # Create the plot
+    fig, ax = plt.subplots(figsize=(20, 12))
+
+    # Plot the choropleth map
+    with run.stage("plot") as stage:
+        merged_continental.plot(column='Obesity', cmap='YlOrBr', linewidth=0.8, edgecolor='0.8',
+                                ax=ax, legend=False)
+        stage.count(merged_continental)
+
+    # Add basemap
+    with run.stage("basemap"):
+        ctx.add_basemap(ax, source=ctx.providers.CartoDB.Positron, alpha=0.5)
+
+    # Set the extent to continental US
+    x1, y1, x2, y2 = merged_continental.total_bounds
+    ax.set_xlim(x1, x2)
+    ax.set_ylim(y1, y2)
+
+    # Create a color bar
+    divider = make_axes_locatable(ax)
+    cax = divider.append_axes("right", size="2%", pad=0.1)
+    sm = plt.cm.ScalarMappable(cmap='YlOrBr', norm=plt.Normalize(vmin=merged_continental['Obesity'].min(),
+                                                                 vmax=merged_continental['Obesity'].max()))
+    sm._A = []
+    cbar = fig.colorbar(sm, cax=cax)
+    cbar.set_label('Obesity Rate (%)', fontsize=14, fontweight='bold')
+    cbar.ax.tick_params(labelsize=12)
+
+    # Add state initials
+    for idx, row in merged_continental.iterrows():
+        state_center = row.geometry.centroid
+        ax.annotate(row['STUSPS'], xy=(state_center.x, state_center.y),
+                    xytext=(3, 3), textcoords="offset points",
+                    fontsize=10, fontweight='bold', ha='center', va='center')
+
+    # Customize the plot
+    ax.set_title('Obesity Rates by State in the Continental United States', fontsize=22, fontweight='bold')
+    ax.axis('off')
+
+    # Add attribution
+    ax.text(0.01, 0.04, 'Map: Rahul shah (@rahul_geo) | Data: HDX & CDC BRFSS',
+            transform=ax.transAxes, fontsize=12, verticalalignment='bottom',
+            bbox=dict(facecolor='white', edgecolor='none', alpha=0.7))
+
+    # Adjust layout and save
+    fig.tight_layout()
+    with run.stage("savefig"):
+        save_figure(fig, output, dpi=dpi, tiled=tiled, ax=ax, crs=merged_continental.crs,
+                    bbox_inches='tight')
+    print(f"Map saved as {output}")
+    if show:
+        plt.show()
+    plt.close(fig)
+    return output
@@ -0,0 +1,201 @@
+# Author: Rahul Shah
+"""Banded high-DPI export.
+
+A 20x15 in map at 300 dpi is a 6000x4500 px Agg canvas, about 100 MB of
+RGBA kept in memory during savefig. `save_figure(..., tiled=True)` renders
+the figure in horizontal bands of `band_rows` pixel rows instead, so only
+one band is in memory at a time, and streams each band into the encoder:
+
+- .png is written by a small streaming PNG encoder (zlib only)
+- .tif/.tiff is written as a tiled GeoTIFF with overviews and converted to
+  a Cloud Optimized GeoTIFF (needs rasterio), with GDAL's block cache
+  capped at GDAL_CACHEMAX_MB
+
+Every band redraws the whole figure clipped to its window, so tiled export
+trades CPU time for bounded peak memory.
+"""
+
+import io
+import os
+import struct
+import tempfile
+import zlib
+
+from matplotlib.transforms import Bbox
+
+BAND_ROWS = 256
+GEOTIFF_EXTENSIONS = (".tif", ".tiff")
+# GeoTIFF tile size; COG bands are whole rows of tiles so no tile is left
+# half written in GDAL's block cache
+COG_BLOCK = 512
+# GDAL's block cache defaults to a share of system RAM; cap it so the
+# GeoTIFF path stays bounded like the PNG one
+GDAL_CACHEMAX_MB = 32
+
+
+def save_figure(fig, output, dpi=300, tiled=False, band_rows=BAND_ROWS,
+                ax=None, crs=None, **savefig_kwargs):
+    """Save `fig` to `output`, in bands if `tiled` or if `output` is a GeoTIFF.
+
+    `ax` and `crs` georeference GeoTIFF output: pixels are mapped to the data
+    limits of `ax`, which must be drawn in `crs` (an EPSG string, WKT, or a
+    pyproj/cartopy CRS).
+    """
+    geotiff = output.lower().endswith(GEOTIFF_EXTENSIONS)
+    if not tiled and not geotiff:
+        fig.savefig(output, dpi=dpi, **savefig_kwargs)
+        return output
+
+    bbox = _export_bbox(fig, dpi, savefig_kwargs.pop("bbox_inches", None),
+                        savefig_kwargs.pop("pad_inches", None))
+    savefig_kwargs.pop("format", None)
+    if geotiff:
+        write_cog(fig, output, bbox, dpi, band_rows, ax, crs, **savefig_kwargs)
+    else:
+        write_png(fig, output, bbox, dpi, band_rows, **savefig_kwargs)
+    return output
+
+
+def iter_bands(fig, bbox, dpi, band_rows=BAND_ROWS, **savefig_kwargs):
+    """Yield (first_row, rows, rgba_buffer) for each band of `bbox` (inches) at `dpi`, top to bottom."""
+    width, height = _pixel_size(bbox, dpi)
+    # like savefig, anchor the image at the bottom-left corner of bbox and
+    # drop the fractional pixel row/column at the top/right
+    image_top = bbox.y0 + height / dpi
+    for first_row in range(0, height, band_rows):
+        rows = min(band_rows, height - first_row)
+        top = image_top - first_row / dpi
+        # the extra half pixel keeps int(size * dpi) from rounding a row or
+        # column away; Agg drops the fractional top row and right column, so
+        # it goes on those edges
+        band = Bbox.from_extents(bbox.x0, top - rows / dpi,
+                                 bbox.x0 + (width + 0.5) / dpi, top + 0.5 / dpi)
+        buf = io.BytesIO()
+        fig.savefig(buf, format="rgba", dpi=dpi, bbox_inches=band, pad_inches=0,
+                    **savefig_kwargs)
+        yield first_row, rows, _check_band(buf.getbuffer(), width, rows)
+
+
+def write_png(fig, output, bbox, dpi, band_rows=BAND_ROWS, **savefig_kwargs):
+    """Render `fig` band by band into an RGBA PNG without holding the full image."""
+    width, height = _pixel_size(bbox, dpi)
+    stride = width * 4
+    compressor = zlib.compressobj(6)
+    with open(output, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        _png_chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+        pixels_per_metre = round(dpi / 0.0254)
+        _png_chunk(f, b"pHYs", struct.pack(">IIB", pixels_per_metre, pixels_per_metre, 1))
+        for _, rows, data in iter_bands(fig, bbox, dpi, band_rows, **savefig_kwargs):
+            # filter type 0 (None) before every scanline
+            scanlines = b"".join(b"\x00" + data[r * stride:(r + 1) * stride] for r in range(rows))
+            compressed = compressor.compress(scanlines)
+            if compressed:
+                _png_chunk(f, b"IDAT", compressed)
+        _png_chunk(f, b"IDAT", compressor.flush())
+        _png_chunk(f, b"IEND", b"")
+    return output
+
+
+def write_cog(fig, output, bbox, dpi, band_rows=BAND_ROWS, ax=None, crs=None, **savefig_kwargs):
+    """Render `fig` band by band into a tiled GeoTIFF, then copy it to a Cloud Optimized GeoTIFF.
+
+    Bands are rounded down to whole rows of COG_BLOCK px tiles (at least one).
+    """
+    try:
+        import numpy as np
+        import rasterio
+        import rasterio.shutil
+        from rasterio.enums import Resampling
+        from rasterio.windows import Window
+    except ImportError as e:
+        raise ImportError("GeoTIFF export needs rasterio: pip install rasterio") from e
+
+    width, height = _pixel_size(bbox, dpi)
+    band_rows = max(COG_BLOCK, band_rows - band_rows % COG_BLOCK)
+    profile = dict(driver="GTiff", width=width, height=height, count=4, dtype="uint8",
+                   tiled=True, blockxsize=COG_BLOCK, blockysize=COG_BLOCK, compress="deflate",
+                   photometric="RGB", alpha="YES", BIGTIFF="IF_SAFER")
+    if ax is not None and crs is not None:
+        # pyproj and cartopy CRS objects -> WKT
+        crs = crs.to_wkt() if hasattr(crs, "to_wkt") else crs
+        profile.update(crs=crs, transform=_geotransform(fig, ax, bbox, dpi))
+
+    with rasterio.Env(GDAL_CACHEMAX=GDAL_CACHEMAX_MB), \
+            tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(output))) as tmp:
+        striped = os.path.join(tmp, "bands.tif")
+        with rasterio.open(striped, "w", **profile) as dst:
+            for first_row, rows, data in iter_bands(fig, bbox, dpi, band_rows, **savefig_kwargs):
+                band = np.frombuffer(data, dtype=np.uint8).reshape(rows, width, 4)
+                dst.write(band.transpose(2, 0, 1), window=Window(0, first_row, width, rows))
+            factors = []
+            while max(width, height) // 2 ** (len(factors) + 1) >= 256:
+                factors.append(2 ** (len(factors) + 1))
+            if factors:
+                dst.build_overviews(factors, Resampling.average)
+        rasterio.shutil.copy(striped, output, driver="COG", compress="deflate")
+    return output
+
+
+def _export_bbox(fig, dpi, bbox_inches, pad_inches):
+    """The region of `fig` to export at `dpi`, in inches, as savefig would choose it."""
+    if bbox_inches is None:
+        return Bbox.from_bounds(0, 0, *fig.get_size_inches())
+    if isinstance(bbox_inches, Bbox):
+        return bbox_inches
+    if bbox_inches != "tight":
+        raise ValueError(f"bbox_inches must be None, 'tight' or a Bbox, got {bbox_inches!r}")
+    import matplotlib as mpl
+    from matplotlib.backends.backend_agg import RendererAgg
+    if pad_inches is None:
+        pad_inches = mpl.rcParams["savefig.pad_inches"]
+    # text extents depend on the dpi (hinting), so measure at the export dpi;
+    # they only need the renderer's dpi, not its canvas, so a 1x1 px Agg
+    # renderer gives the same box as savefig without the full-size buffer
+    original_dpi = fig.dpi
+    fig.set_dpi(dpi)
+    try:
+        tight = fig.get_tightbbox(RendererAgg(1, 1, dpi))
+    finally:
+        fig.set_dpi(original_dpi)
+    return tight.padded(pad_inches)
+
+
+def _geotransform(fig, ax, bbox, dpi):
+    """Affine transform from exported pixels to the data coordinates of `ax`."""
+    from matplotlib.backends.backend_agg import RendererAgg
+    from rasterio.transform import Affine
+
+    # apply_aspect() on its own starts from the axes' original position;
+    # axes placed by a locator (e.g. make_axes_locatable) must start from
+    # the box the locator gives them, as they do when the figure is drawn
+    locator = ax.get_axes_locator()
+    ax.apply_aspect(locator(ax, RendererAgg(1, 1, dpi)) if locator else None)
+    fig_width, fig_height = fig.get_size_inches()
+    position = ax.get_position()
+    first_col = (position.x0 * fig_width - bbox.x0) * dpi
+    first_row = (bbox.y1 - position.y1 * fig_height) * dpi
+    xmin, xmax = ax.get_xlim()
+    ymin, ymax = ax.get_ylim()
+    x_size = (xmax - xmin) / (position.width * fig_width * dpi)
+    y_size = (ymax - ymin) / (position.height * fig_height * dpi)
+    return Affine(x_size, 0, xmin - first_col * x_size,
+                  0, -y_size, ymax + first_row * y_size)
+
+
+def _pixel_size(bbox, dpi):
+    # Agg truncates the canvas size, so savefig does too
+    return max(1, int(bbox.width * dpi)), max(1, int(bbox.height * dpi))
+
+
+def _check_band(data, width, rows):
+    if len(data) != width * rows * 4:
+        raise RuntimeError(f"Expected a {width}x{rows} px band, got {len(data)} bytes")
+    return data
+
+
+def _png_chunk(f, kind, data):
+    f.write(struct.pack(">I", len(data)))
+    f.write(kind)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
@@ -0,0 +1,28 @@
+# Author: Rahul Shah
+"""NASA FIRMS area API client shared by the day 1 maps."""
+
+from io import StringIO
+
+import pandas as pd
+import requests
+
+main_url = "https://firms.modaps.eosdis.nasa.gov/api/area/csv"
+
+# Contiguous US: xmin, ymin, xmax, ymax
+area = (-125.0, 24.0, -66.0, 49.5)
+area_coords = ",".join(str(c) for c in area)
+
+
+def get_fire_data(main_url, map_key, source, area, day_range, date):
+    url = f"{main_url}/{map_key}/{source}/{area}/{day_range}/{date}"
+    response = requests.get(url)
+    if response.status_code == 200:
+        try:
+            fire_data = pd.read_csv(StringIO(response.content.decode('utf-8')))
+            return fire_data
+        except pd.errors.EmptyDataError:
+            print("The API returned an empty dataset.")
+            return pd.DataFrame()
+    else:
+        print(f"API request failed with status code {response.status_code}")
+        return pd.DataFrame()
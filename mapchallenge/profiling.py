@@ -0,0 +1,232 @@
+# Author: Rahul Shah
+"""Stage-level timing for the map pipelines.
+
+Wrap each step of a script (download, read_file, overlay, simplify, plot,
+savefig, ...) in ``run.stage(...)`` and call ``run.write()`` at the end to
+get one JSON report per run:
+
+    run = RunProfiler("day22")
+    with run.stage("read_file") as stage:
+        vessel_data = gpd.read_file(gdb_folder)
+        stage.count(vessel_data)
+    run.write()
+
+Memory is reported per stage as the resident set size at the start and end
+of the stage plus the peak sampled while it ran (every 10 ms, so very short
+spikes can be missed); the run as a whole also reports the process-wide
+high-water mark.
+
+Reports go to profiles/<run>/ by default; set MAPCHALLENGE_PROFILE_DIR to
+change where the report (and any cProfile dumps) are written, and
+MAPCHALLENGE_CPROFILE=1 to dump a .prof file per stage.
+"""
+
+import cProfile
+import functools
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+MB = 1024 * 1024
+SAMPLE_INTERVAL_S = 0.01
+
+
+def process_peak_rss_mb():
+    """Peak resident set size of this process over its whole life, in MB (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    if sys.platform == "darwin":
+        return peak / MB
+    return peak / 1024
+
+
+def current_rss_mb():
+    """Current resident set size of this process, in MB (None if unknown)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / MB
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss / MB
+
+
+class RssSampler:
+    """Tracks the highest current_rss_mb() seen between start() and stop()."""
+
+    def __init__(self, interval=SAMPLE_INTERVAL_S):
+        self.interval = interval
+        self.start_mb = self.end_mb = self.peak_mb = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self.start_mb = self.peak_mb = current_rss_mb()
+        if self.start_mb is not None:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        self.end_mb = current_rss_mb()
+        if self.end_mb is not None:
+            self.peak_mb = max(self.peak_mb, self.end_mb)
+        return self
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            rss = current_rss_mb()
+            if rss is not None:
+                self.peak_mb = max(self.peak_mb, rss)
+
+
+def count_vertices(data):
+    """Total number of coordinates in a GeoDataFrame/GeoSeries (None if not geometric)."""
+    geometry = getattr(data, "geometry", None)
+    if geometry is None:
+        return None
+    import shapely
+    return int(shapely.get_num_coordinates(geometry.values).sum())
+
+
+class Stage:
+    """Measurements for one pipeline stage."""
+
+    def __init__(self, name):
+        self.name = name
+        self.rows = None
+        self.vertices = None
+        self.wall_s = None
+        self.cpu_s = None
+        self.rss_start_mb = None
+        self.rss_end_mb = None
+        self.peak_rss_mb = None
+        self.profile_path = None
+        self.error = None
+
+    def count(self, data=None, rows=None, vertices=None):
+        """Record row and vertex counts, either from `data` or given explicitly."""
+        if data is not None:
+            rows = len(data) if rows is None else rows
+            vertices = count_vertices(data) if vertices is None else vertices
+        if rows is not None:
+            self.rows = int(rows)
+        if vertices is not None:
+            self.vertices = int(vertices)
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "wall_s": self.wall_s,
+            "cpu_s": self.cpu_s,
+            "rss_start_mb": self.rss_start_mb,
+            "rss_end_mb": self.rss_end_mb,
+            "rss_delta_mb": (None if self.rss_start_mb is None or self.rss_end_mb is None
+                             else self.rss_end_mb - self.rss_start_mb),
+            "peak_rss_mb": self.peak_rss_mb,
+            "rows": self.rows,
+            "vertices": self.vertices,
+            "profile_path": self.profile_path,
+            "error": self.error,
+        }
+
+
+class RunProfiler:
+    """Collects stage measurements for one script run and writes them as JSON."""
+
+    def __init__(self, run_name, output_dir=None, cprofile=None):
+        self.run_name = run_name
+        self.output_dir = output_dir or os.environ.get("MAPCHALLENGE_PROFILE_DIR", "profiles")
+        if cprofile is None:
+            cprofile = os.environ.get("MAPCHALLENGE_CPROFILE", "") not in ("", "0")
+        self.cprofile = cprofile
+        self.started = datetime.now(timezone.utc)
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block as stage `name`; yields the Stage to record counts on."""
+        stage = Stage(name)
+        profiler = cProfile.Profile() if self.cprofile else None
+        sampler = RssSampler().start()
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield stage
+        except BaseException as e:
+            stage.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            stage.wall_s = time.perf_counter() - start_wall
+            stage.cpu_s = time.process_time() - start_cpu
+            sampler.stop()
+            stage.rss_start_mb = sampler.start_mb
+            stage.rss_end_mb = sampler.end_mb
+            stage.peak_rss_mb = sampler.peak_mb
+            if profiler is not None:
+                safe_name = re.sub(r"[^\w.-]+", "_", name)
+                stage.profile_path = self._path(f"{len(self.stages):02d}_{safe_name}.prof")
+                profiler.dump_stats(stage.profile_path)
+            self.stages.append(stage)
+
+    def profiled(self, name=None):
+        """Decorator form of `stage`; counts rows/vertices of the return value."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(name or func.__name__) as stage:
+                    result = func(*args, **kwargs)
+                    if hasattr(result, "__len__"):
+                        stage.count(result)
+                    return result
+            return wrapper
+        return decorator
+
+    def as_dict(self):
+        return {
+            "run": self.run_name,
+            "started": self.started.isoformat(),
+            "wall_s": time.perf_counter() - self._start_wall,
+            "cpu_s": time.process_time() - self._start_cpu,
+            "rss_mb": current_rss_mb(),
+            "process_peak_rss_mb": process_peak_rss_mb(),
+            "stages": [stage.as_dict() for stage in self.stages],
+        }
+
+    def write(self, path=None):
+        """Write the run report as JSON and return its path."""
+        path = path or self._path(f"profile_{self.started:%Y%m%dT%H%M%S_%f}.json")
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+        print(f"Profile for {self.run_name} saved as '{path}'")
+        return path
+
+    def _path(self, file_name):
+        folder = os.path.join(self.output_dir, self.run_name)
+        os.makedirs(folder, exist_ok=True)
+        return os.path.join(folder, file_name)
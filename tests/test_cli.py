@@ -0,0 +1,20 @@
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+import mapchallenge  # noqa: E402
+from mapchallenge import cli  # noqa: E402
+
+
+def test_render_closes_figures_of_failed_requests(tmp_path, monkeypatch):
+    def failing_render(day, run=None, **params):
+        plt.subplots()
+        raise OSError("output not writable")
+
+    monkeypatch.setattr(mapchallenge, "render", failing_render)
+    monkeypatch.setenv("MAPCHALLENGE_PROFILE_DIR", str(tmp_path))
+    result = cli.render("day2", {})
+    assert result["error"] == "OSError: output not writable"
+    assert plt.get_fignums() == []
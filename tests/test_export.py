@@ -0,0 +1,106 @@
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from mapchallenge.export import save_figure  # noqa: E402
+
+BAND_ROWS = 37
+
+
+def make_figure():
+    fig, ax = plt.subplots(figsize=(6, 4.5))
+    fig.patch.set_facecolor("black")
+    ax.set_facecolor("#202020")
+    x = np.linspace(0, 10, 400)
+    for i in range(12):
+        ax.plot(x, np.sin(x + i) * i, lw=0.8)
+    ax.set_title("Title", fontsize=24, color="white")
+    # runs off the right edge, so 'tight' must grow the box to fit it
+    ax.text(0.6, 0.05, "attribution running off the edge", fontsize=30,
+            color="white", transform=ax.transAxes)
+    return fig, ax
+
+
+def read_png(path_or_buffer):
+    return np.asarray(Image.open(path_or_buffer).convert("RGBA")).astype(int)
+
+
+def render_both(tmp_path, dpi, bbox_inches):
+    fig, _ = make_figure()
+    expected = io.BytesIO()
+    fig.savefig(expected, format="png", dpi=dpi, bbox_inches=bbox_inches, facecolor="black")
+    output = str(tmp_path / "tiled.png")
+    save_figure(fig, output, dpi=dpi, tiled=True, band_rows=BAND_ROWS,
+                bbox_inches=bbox_inches, facecolor="black")
+    plt.close(fig)
+    return read_png(expected), read_png(output)
+
+
+@pytest.mark.parametrize("dpi", [72, 97, 150, 300])
+@pytest.mark.parametrize("bbox_inches", [None, "tight"])
+def test_tiled_png_matches_savefig(tmp_path, dpi, bbox_inches):
+    # path simplification runs on each band's clipped copy of a line, so it
+    # can pick slightly different vertices than on the whole line; without
+    # it the bands must reproduce savefig: lines cut at a band edge may
+    # anti-alias differently on the rows touching it, and only by rounding
+    # elsewhere
+    with matplotlib.rc_context({"path.simplify": False}):
+        expected, actual = render_both(tmp_path, dpi, bbox_inches)
+    assert actual.shape == expected.shape
+    difference = np.abs(actual - expected).max(axis=-1)
+    rows = np.arange(difference.shape[0])
+    distance_to_seam = np.minimum(rows % BAND_ROWS, BAND_ROWS - rows % BAND_ROWS)
+    assert difference[distance_to_seam > 1].max() <= 2
+    assert (difference > 2).mean() < 0.001
+
+
+@pytest.mark.parametrize("bbox_inches", [None, "tight"])
+def test_tiled_png_close_to_savefig_with_simplification(tmp_path, bbox_inches):
+    expected, actual = render_both(tmp_path, 150, bbox_inches)
+    assert actual.shape == expected.shape
+    assert (np.abs(actual - expected).max(axis=-1) > 8).mean() < 0.005
+
+
+@pytest.mark.parametrize("colorbar", [False, True])
+def test_cog_transform_maps_axes_corners_to_limits(tmp_path, colorbar):
+    rasterio = pytest.importorskip("rasterio")
+    fig, ax = plt.subplots(figsize=(6, 4))
+    fig.patch.set_facecolor("white")
+    ax.set_facecolor("red")
+    ax.set_xlim(-125, -66)
+    ax.set_ylim(24, 49.5)
+    ax.set_aspect("equal")
+    ax.set_xticks([])
+    ax.set_yticks([])
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.set_title("Title")
+    if colorbar:
+        # like day8: the divider gives ax an axes locator that shrinks it
+        from mpl_toolkits.axes_grid1 import make_axes_locatable
+        cax = make_axes_locatable(ax).append_axes("right", size="2%", pad=0.1)
+        fig.colorbar(plt.cm.ScalarMappable(cmap="Blues"), cax=cax)
+        fig.tight_layout()
+    output = str(tmp_path / "map.tif")
+    save_figure(fig, output, dpi=150, band_rows=BAND_ROWS, ax=ax, crs="EPSG:4326",
+                bbox_inches="tight", facecolor="white")
+    plt.close(fig)
+
+    with rasterio.open(output) as src:
+        t = src.transform
+        a, c, e, f = t.a, t.c, t.e, t.f
+        image = src.read()
+        assert src.crs.to_epsg() == 4326
+        assert src.overviews(1)
+    red = np.argwhere((image[0] > 200) & (image[1] < 50) & (image[2] < 50))
+    (top, left), (bottom, right) = red.min(axis=0), red.max(axis=0) + 1
+    assert c + left * a == pytest.approx(-125, abs=abs(a))
+    assert c + right * a == pytest.approx(-66, abs=abs(a))
+    assert f + top * e == pytest.approx(49.5, abs=abs(e))
+    assert f + bottom * e == pytest.approx(24, abs=abs(e))
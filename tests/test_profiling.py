@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from mapchallenge.profiling import RunProfiler, count_vertices, current_rss_mb
+
+needs_rss = pytest.mark.skipif(current_rss_mb() is None, reason="RSS not readable here")
+
+
+@needs_rss
+def test_peak_rss_is_per_stage(tmp_path):
+    run = RunProfiler("test", output_dir=str(tmp_path))
+    with run.stage("big"):
+        block = bytearray(200 * 1024 * 1024)
+        block[::4096] = b"1" * len(block[::4096])
+        del block
+    with run.stage("small") as stage:
+        stage.count([1, 2, 3])
+
+    big, small = run.stages
+    assert big.peak_rss_mb - big.rss_start_mb > 150
+    # the later stage must not inherit the earlier stage's peak
+    assert small.peak_rss_mb < big.peak_rss_mb - 150
+    assert small.rows == 3
+
+    report = json.load(open(run.write()))
+    assert report["process_peak_rss_mb"] >= big.peak_rss_mb - 1
+    assert [s["name"] for s in report["stages"]] == ["big", "small"]
+    assert report["stages"][0]["rss_delta_mb"] is not None
+
+
+def test_stage_records_errors(tmp_path):
+    run = RunProfiler("test", output_dir=str(tmp_path))
+    with pytest.raises(ValueError):
+        with run.stage("broken"):
+            raise ValueError("boom")
+    assert run.stages[0].error == "ValueError: boom"
+    assert run.stages[0].wall_s is not None
+
+
+def test_profiled_records_a_stage(tmp_path):
+    run = RunProfiler("test", output_dir=str(tmp_path))
+
+    @run.profiled()
+    def download(n):
+        return list(range(n))
+
+    @run.profiled("simplify")
+    def shrink(items):
+        return items[:2]
+
+    assert shrink(download(5)) == [0, 1]
+    assert download.__name__ == "download"
+    first, second = run.stages
+    assert (first.name, first.rows) == ("download", 5)
+    assert (second.name, second.rows) == ("simplify", 2)
+    assert first.wall_s is not None and first.error is None
+
+
+def test_count_vertices_of_geoseries(tmp_path):
+    pytest.importorskip("shapely")
+    gpd = pytest.importorskip("geopandas")
+    from shapely.geometry import LineString, Point, Polygon
+
+    series = gpd.GeoSeries([Point(0, 0),
+                            LineString([(0, 0), (1, 1), (2, 0)]),
+                            Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])])
+    # a polygon ring repeats its first coordinate: 1 + 3 + 5
+    assert count_vertices(series) == 9
+    assert count_vertices(gpd.GeoDataFrame(geometry=series)) == 9
+    assert count_vertices([1, 2, 3]) is None
+
+    run = RunProfiler("test", output_dir=str(tmp_path))
+    with run.stage("read_file") as stage:
+        stage.count(series)
+    assert (run.stages[0].rows, run.stages[0].vertices) == (3, 9)